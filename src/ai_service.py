@@ -4,12 +4,72 @@ AI service interfaces and implementations.
 This module provides abstractions for AI model interactions
 """
 
+import dataclasses
+import hashlib
+import logging
 import os
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
 from src.models.models import PromptData, ModelResponse
-from src.config import GEMINI_MODEL_ID, GEMINI_MODEL_NAME
-from datetime import datetime
+from src.config import (
+    GEMINI_MODEL_ID,
+    GEMINI_MODEL_NAME,
+    GEMINI_EMBEDDING_MODEL_ID,
+    GEMINI_CACHE_TTL,
+    SEMANTIC_CACHE_THRESHOLD,
+    SEMANTIC_CACHE_RETRY_AFTER,
+)
+
+logger = logging.getLogger(__name__)
+
+try:
+    import google.generativeai as genai
+except ImportError:  # pragma: no cover - optional in test environments
+    genai = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to NumPy
+    njit = None
+
+
+if njit is not None:
+    # Serial on purpose: a parallel kernel first called from a non-main thread
+    # (Streamlit's script runners) keeps the interpreter from exiting
+    @njit(fastmath=True, cache=True)
+    def _best_match(embeddings: np.ndarray, query: np.ndarray, threshold: float) -> Tuple[int, float]:
+        """
+        Return (index, score) of the row most similar to query.
+
+        index is -1 when no row reaches the threshold.
+        """
+        n, d = embeddings.shape
+        scores = np.empty(n, dtype=np.float32)
+        for i in range(n):
+            score = np.float32(0.0)
+            for j in range(d):
+                score += embeddings[i, j] * query[j]
+            scores[i] = score
+        best = np.argmax(scores)
+        if scores[best] < threshold:
+            return -1, scores[best]
+        return best, scores[best]
+else:
+    def _best_match(embeddings: np.ndarray, query: np.ndarray, threshold: float) -> Tuple[int, float]:
+        """
+        Return (index, score) of the row most similar to query.
+
+        index is -1 when no row reaches the threshold.
+        """
+        scores = embeddings @ query
+        best = int(np.argmax(scores))
+        if scores[best] < threshold:
+            return -1, float(scores[best])
+        return best, float(scores[best])
 
 
 def _extract_text_safely(response) -> str:
@@ -20,6 +80,25 @@ def _extract_text_safely(response) -> str:
     safety filters, finish_reason SAFETY/RECITATION/OTHER). This function
     handles those cases and returns a fallback message.
     """
+    return _model_text(response) or _diagnose(response)
+
+
+def _model_text(response) -> Optional[str]:
+    """Return the text of a normal response's first part, or None if it has none."""
+    try:
+        text = response.candidates[0].content.parts[0].text
+    except (AttributeError, IndexError, TypeError, ValueError):
+        return None
+    return text or None
+
+
+def _diagnose(response) -> str:
+    """
+    Inspect a response without usable text and explain why.
+
+    Returns "" when the first part exists but is empty, otherwise a fallback
+    message derived from the candidate's finish_reason.
+    """
     try:
         candidates = getattr(response, "candidates", None) or []
         if not candidates:
@@ -42,17 +121,233 @@ def _extract_text_safely(response) -> str:
         return "[Unable to parse the model response.]"
 
 
+_FINISH_REASON_MESSAGES = {
+    "SAFETY": "[Response blocked by safety filters. Try rephrasing your prompt.]",
+    "RECITATION": "[Response blocked due to potential recitation of training data.]",
+    "MAX_TOKENS": "[Response was truncated due to token limit.]",
+}
+_DEFAULT_FINISH_MESSAGE = "[No text was returned. The model may have declined to respond.]"
+
+
 def _finish_reason_message(candidate) -> str:
     """Return a user-friendly message based on finish_reason."""
     reason = getattr(candidate, "finish_reason", None)
-    reason_str = str(reason).upper() if reason is not None else ""
-    if "SAFETY" in reason_str:
-        return "[Response blocked by safety filters. Try rephrasing your prompt.]"
-    if "RECITATION" in reason_str:
-        return "[Response blocked due to potential recitation of training data.]"
-    if "MAX_TOKENS" in reason_str:
-        return "[Response was truncated due to token limit.]"
-    return "[No text was returned. The model may have declined to respond.]"
+    if reason is None:
+        return _DEFAULT_FINISH_MESSAGE
+    # Enum members expose .name; plain strings look like "FinishReason.SAFETY"
+    reason_name = getattr(reason, "name", None) or str(reason)
+    return _FINISH_REASON_MESSAGES.get(
+        reason_name.rsplit(".", 1)[-1].upper(), _DEFAULT_FINISH_MESSAGE
+    )
+
+
+def _chunk_text(chunk) -> str:
+    """Return the text of a streamed chunk, or "" if it carries none."""
+    try:
+        return chunk.candidates[0].content.parts[0].text or ""
+    except (AttributeError, IndexError, TypeError, ValueError):
+        return ""
+
+
+def _extract_tokens_used(response, response_text: str) -> Optional[int]:
+    """Return the token count reported by the API, or a length-based estimate."""
+    tokens_used = None
+
+    try:
+        usage = response.usage_metadata
+        if usage:
+            total_tokens = usage.total_token_count or usage.candidates_token_count
+            if total_tokens is not None:
+                tokens_used = int(total_tokens)
+    except AttributeError:
+        pass
+
+    if tokens_used is None and response_text:
+        # Fast heuristic: an average English token is about 4 characters
+        tokens_used = max(1, len(response_text) // 4)
+
+    return tokens_used
+
+
+# Canonical copies of system prompts, so the many responses produced under
+# the same prompt (e.g. one Engage level) share a single string object
+_PROMPT_POOL: Dict[str, str] = {}
+_PROMPT_POOL_MAX_ENTRIES = 256
+
+
+def _pooled_prompt(prompt: str) -> str:
+    """Return the pooled copy of a prompt, adding it while there is room."""
+    pooled = _PROMPT_POOL.get(prompt)
+    if pooled is not None:
+        return pooled
+    if len(_PROMPT_POOL) < _PROMPT_POOL_MAX_ENTRIES:
+        _PROMPT_POOL[prompt] = prompt
+    return prompt
+
+
+def _cache_key(model_id: str, system_prompt: str, user_prompt: str) -> str:
+    """Return the SHA-256 digest identifying a (model, system, user) request."""
+    digest = hashlib.sha256()
+    for part in (model_id, system_prompt, user_prompt):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """
+    Exact-match LRU cache of response texts.
+
+    Entries are stored after a request completes, which lets streamed
+    responses be cached once their last chunk has arrived. Entries expire
+    ttl seconds after they are stored.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float = GEMINI_CACHE_TTL):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of entries kept before evicting the
+                least recently used one
+            ttl: Seconds an entry stays valid after it is stored
+        """
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached result for a key, marking it recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return result
+
+    def put(self, key: str, result: str) -> None:
+        """Store a result, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, result)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SemanticCache:
+    """
+    Cache of responses looked up by embedding similarity of the user prompt.
+
+    Entries are partitioned by system prompt, so a paraphrased question is
+    only answered from responses produced under the exact same system prompt
+    (e.g. the same Engage level). Playground system prompts are free text, so
+    the least recently used partition is evicted once there are
+    max_partitions of them. Like the exact cache, entries expire ttl seconds
+    after they are stored.
+    """
+
+    def __init__(
+        self,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        max_entries: int = 256,
+        max_partitions: int = 64,
+        ttl: float = GEMINI_CACHE_TTL,
+    ):
+        """
+        Initialize an empty cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum number of entries kept per system prompt
+            max_partitions: Maximum number of system prompts kept
+            ttl: Seconds an entry stays valid after it is stored
+        """
+        self._threshold = threshold
+        self._max_entries = max_entries
+        self._max_partitions = max_partitions
+        self._ttl = ttl
+        # system prompt -> (embeddings, expiry times, responses), row-aligned
+        self._partitions: "OrderedDict[str, Tuple[np.ndarray, np.ndarray, List[ModelResponse]]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize(embedding) -> np.ndarray:
+        """Return the embedding as an L2-normalized float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, system_prompt: str, embedding: np.ndarray) -> Optional[ModelResponse]:
+        """
+        Find the cached response closest to a normalized prompt embedding.
+
+        Returns:
+            Optional[ModelResponse]: The best match above the threshold, if any
+        """
+        with self._lock:
+            partition = self._partitions.get(system_prompt)
+            if partition is None:
+                return None
+
+            embeddings, expires_at, entries = partition
+            live = expires_at > time.monotonic()
+            if not live.all():
+                if not live.any():
+                    del self._partitions[system_prompt]
+                    return None
+                embeddings, expires_at = embeddings[live], expires_at[live]
+                entries = [entry for entry, keep in zip(entries, live) if keep]
+                self._partitions[system_prompt] = (embeddings, expires_at, entries)
+            self._partitions.move_to_end(system_prompt)
+
+            best, _ = _best_match(embeddings, embedding, self._threshold)
+            if best < 0:
+                return None
+            return entries[best]
+
+    def add(self, system_prompt: str, embedding: np.ndarray, response: ModelResponse) -> None:
+        """Store a response under its normalized prompt embedding."""
+        with self._lock:
+            expiry = np.array([time.monotonic() + self._ttl])
+            partition = self._partitions.get(system_prompt)
+            if partition is None:
+                embeddings, expires_at, entries = embedding[np.newaxis, :], expiry, [response]
+            else:
+                embeddings, expires_at, entries = partition
+                embeddings = np.vstack((embeddings, embedding))
+                expires_at = np.concatenate((expires_at, expiry))
+                entries.append(response)
+
+            if len(entries) > self._max_entries:
+                embeddings = embeddings[-self._max_entries:]
+                expires_at = expires_at[-self._max_entries:]
+                del entries[:-self._max_entries]
+            self._partitions[system_prompt] = (embeddings, expires_at, entries)
+            self._partitions.move_to_end(system_prompt)
+            if len(self._partitions) > self._max_partitions:
+                self._partitions.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._partitions.clear()
+
+
+# Shared by every service instance so cached answers survive script reruns
+_RESPONSE_CACHE = ResponseCache()
+_SEMANTIC_CACHE = SemanticCache()
 
 
 class AIServiceInterface(ABC):
@@ -73,6 +368,25 @@ class AIServiceInterface(ABC):
         """
         pass
 
+    def generate_response_stream(
+        self, prompt_data: PromptData, on_chunk: Callable[[str], None]
+    ) -> ModelResponse:
+        """
+        Generate a response, reporting text to on_chunk as it is produced.
+
+        Services without streaming support emit the whole text as one chunk.
+
+        Args:
+            prompt_data: The prompt data containing system and user prompts
+            on_chunk: Called with each piece of response text, in order
+
+        Returns:
+            ModelResponse: The complete response from the AI model
+        """
+        response = self.generate_response(prompt_data)
+        on_chunk(response.response_text)
+        return response
+
     @abstractmethod
     def get_model_name(self) -> str:
         """
@@ -87,6 +401,8 @@ class AIServiceInterface(ABC):
 class GeminiService(AIServiceInterface):
     """Google Gemini API implementation"""
 
+    _MODEL_CACHE_SIZE = 64
+
     def __init__(self):
         """Initialize the Gemini service"""
         self._api_key = os.getenv("GEMINI_API_KEY")
@@ -94,7 +410,45 @@ class GeminiService(AIServiceInterface):
             raise ValueError(
                 "GEMINI_API_KEY environment variable is not set"
             )
+        if genai is None:
+            raise ValueError(
+                "google-generativeai is not installed"
+            )
+        genai.configure(api_key=self._api_key)
         self._model_name = GEMINI_MODEL_NAME
+        self._model_cache: Dict[str, "genai.GenerativeModel"] = {}
+        self._model_cache_lock = threading.Lock()
+        # Monotonic time until which the semantic cache is skipped after an
+        # embedding failure
+        self._embed_retry_at = 0.0
+
+    def _embed_prompt(self, user_prompt: str) -> Optional[np.ndarray]:
+        """
+        Embed a user prompt for semantic cache lookups.
+
+        A failed call is logged and disables embedding for
+        SEMANTIC_CACHE_RETRY_AFTER seconds, so requests don't each pay for
+        a failing extra network call while the embedding model is unusable.
+
+        Returns:
+            Optional[np.ndarray]: The normalized embedding, or None if the
+            embedding call failed or is cooling down (the request then
+            bypasses the cache)
+        """
+        if time.monotonic() < self._embed_retry_at:
+            return None
+        try:
+            result = genai.embed_content(model=GEMINI_EMBEDDING_MODEL_ID, content=user_prompt)
+        except Exception:
+            logger.warning(
+                "Embedding with %s failed; semantic cache disabled for %.0fs",
+                GEMINI_EMBEDDING_MODEL_ID,
+                SEMANTIC_CACHE_RETRY_AFTER,
+                exc_info=True,
+            )
+            self._embed_retry_at = time.monotonic() + SEMANTIC_CACHE_RETRY_AFTER
+            return None
+        return SemanticCache.normalize(result["embedding"])
 
     def generate_response(self, prompt_data: PromptData) -> ModelResponse:
         """
@@ -106,40 +460,144 @@ class GeminiService(AIServiceInterface):
         Returns:
             ModelResponse: The generated response from Gemini
         """
-        import google.generativeai as genai
+        return self._respond(prompt_data, on_chunk=None)
 
-        genai.configure(api_key=self._api_key)
-
-        model_kwargs = {}
-        if prompt_data.system_prompt.strip():
-            model_kwargs["system_instruction"] = prompt_data.system_prompt.strip()
+    def generate_response_stream(
+        self, prompt_data: PromptData, on_chunk: Callable[[str], None]
+    ) -> ModelResponse:
+        """
+        Generate a response using the Gemini API, streaming text to on_chunk.
 
-        model = genai.GenerativeModel(GEMINI_MODEL_ID, **model_kwargs)
-        response = model.generate_content(prompt_data.user_prompt)
+        Args:
+            prompt_data: The prompt data containing system and user prompts
+            on_chunk: Called with each piece of response text, in order
 
-        response_text = _extract_text_safely(response)
-        tokens_used = None
+        Returns:
+            ModelResponse: The complete response from Gemini
+        """
+        return self._respond(prompt_data, on_chunk=on_chunk)
 
-        if hasattr(response, "usage_metadata") and response.usage_metadata:
-            usage = response.usage_metadata
-            total_tokens = getattr(usage, "total_token_count", None) or getattr(
-                usage, "candidates_token_count", None
-            )
-            if total_tokens is not None:
-                tokens_used = int(total_tokens)
+    def _respond(
+        self, prompt_data: PromptData, on_chunk: Optional[Callable[[str], None]]
+    ) -> ModelResponse:
+        """
+        Answer a prompt from the caches or, on a miss, from the model.
 
-        if tokens_used is None and response_text:
-            tokens_used = len(response_text.split())
+        Identical (model, system prompt, user prompt) requests are answered
+        from the exact cache; near-duplicate user prompts under the same
+        system prompt are served from the semantic cache. Only misses on both
+        call the generation API. Cached answers are emitted as a single chunk
+        and carry tokens_used=None, since answering them spent no tokens.
+        """
+        key = _cache_key(GEMINI_MODEL_ID, prompt_data.system_prompt_stripped, prompt_data.user_prompt)
+        cached_response = self._cached_response(prompt_data, key)
+        if cached_response is not None:
+            if on_chunk is not None:
+                on_chunk(cached_response.response_text)
+            return cached_response
+
+        embedding = self._embed_prompt(prompt_data.user_prompt)
+        if embedding is not None:
+            cached = _SEMANTIC_CACHE.lookup(prompt_data.system_prompt_stripped, embedding)
+            if cached is not None:
+                if on_chunk is not None:
+                    on_chunk(cached.response_text)
+                return dataclasses.replace(
+                    cached,
+                    user_prompt=prompt_data.user_prompt,
+                    timestamp=time.time_ns(),
+                    tokens_used=None,
+                )
+
+        response_text, tokens_used, from_model = self._generate(prompt_data, on_chunk)
+        response = self._build_response(prompt_data, response_text, tokens_used)
+
+        # Fallback messages (blocked, empty or unparsable responses) are not
+        # cached, so retrying the prompt asks the model again
+        if from_model:
+            _RESPONSE_CACHE.put(key, response_text)
+            if embedding is not None:
+                _SEMANTIC_CACHE.add(prompt_data.system_prompt_stripped, embedding, response)
+        return response
+
+    def _cached_response(self, prompt_data: PromptData, key: str) -> Optional[ModelResponse]:
+        """Build a response from the exact cache entry for key, if any."""
+        response_text = _RESPONSE_CACHE.get(key)
+        if response_text is None:
+            return None
+        return self._build_response(prompt_data, response_text, None)
+
+    def _generate(
+        self, prompt_data: PromptData, on_chunk: Optional[Callable[[str], None]]
+    ) -> Tuple[str, Optional[int], bool]:
+        """
+        Call the Gemini API and return (response_text, tokens_used, from_model).
 
-        return ModelResponse(
+        from_model is False when the model returned no text and response_text
+        is a fallback message explaining why. When on_chunk is given the
+        response is requested as a stream and each chunk's text is forwarded
+        as it arrives.
+        """
+        model = self._get_model(prompt_data.system_prompt_stripped)
+
+        if on_chunk is None:
+            response = model.generate_content(prompt_data.user_prompt)
+            response_text = _model_text(response)
+            from_model = response_text is not None
+            if not from_model:
+                response_text = _diagnose(response)
+            return response_text, _extract_tokens_used(response, response_text), from_model
+
+        parts = []
+        response = None
+        for response in model.generate_content(prompt_data.user_prompt, stream=True):
+            text = _chunk_text(response)
+            if text:
+                parts.append(text)
+                on_chunk(text)
+
+        response_text = "".join(parts)
+        from_model = bool(response_text)
+        if not from_model:
+            # Nothing streamed: report why, based on the final chunk
+            response_text = _extract_text_safely(response)
+            on_chunk(response_text)
+        return response_text, _extract_tokens_used(response, response_text), from_model
+
+    def _get_model(self, system_instruction: str) -> "genai.GenerativeModel":
+        """Return the model for a system instruction, creating it on first use."""
+        # The service is shared across sessions, each on its own script thread
+        with self._model_cache_lock:
+            model = self._model_cache.get(system_instruction)
+            if model is None:
+                model_kwargs = {}
+                if system_instruction:
+                    model_kwargs["system_instruction"] = system_instruction
+                model = genai.GenerativeModel(GEMINI_MODEL_ID, **model_kwargs)
+                if len(self._model_cache) >= self._MODEL_CACHE_SIZE:
+                    # Playground system prompts are free text; evict the oldest
+                    self._model_cache.pop(next(iter(self._model_cache)))
+                self._model_cache[system_instruction] = model
+            return model
+
+    def _build_response(
+        self, prompt_data: PromptData, response_text: str, tokens_used: Optional[int]
+    ) -> ModelResponse:
+        """Build a ModelResponse for a prompt, stamped with the current time."""
+        return ModelResponse.from_llm(
             model_name=self._model_name,
             response_text=response_text,
             user_prompt=prompt_data.user_prompt,
-            system_prompt=prompt_data.system_prompt,
-            timestamp=datetime.now(),
+            system_prompt=_pooled_prompt(prompt_data.system_prompt),
+            timestamp=time.time_ns(),
             tokens_used=tokens_used,
         )
 
+    def clear_cache(self) -> None:
+        """Drop all cached responses."""
+        _RESPONSE_CACHE.clear()
+        _SEMANTIC_CACHE.clear()
+
     def get_model_name(self) -> str:
         """
         Get the model name
@@ -1,4 +1,3 @@
-import os
 """
 Configuration module for the AI Playground application.
 
@@ -6,10 +5,28 @@ This module contains all configuration constants, settings
 used throughout the application.
 """
 
+import functools
+import os
+import sys
+from pathlib import Path
+from types import MappingProxyType
+
+_STYLES_PATH = Path(__file__).with_name("styles.css")
+
 # Gemini model configuration
 GEMINI_MODEL_ID = os.getenv("GEMINI_MODEL_ID", "gemini-3-flash-preview") 
 GEMINI_MODEL_NAME = os.getenv("GEMINI_MODEL_NAME", "Gemini 3")  
 
+# Exact-match response cache: identical prompts are answered from the cache
+# for up to GEMINI_CACHE_TTL seconds
+GEMINI_CACHE_TTL = float(os.getenv("GEMINI_CACHE_TTL", "3600"))
+
+# Semantic cache configuration
+GEMINI_EMBEDDING_MODEL_ID = os.getenv("GEMINI_EMBEDDING_MODEL_ID", "models/text-embedding-004")
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))
+# After an embedding call fails, skip the semantic cache for this many seconds
+SEMANTIC_CACHE_RETRY_AFTER = float(os.getenv("SEMANTIC_CACHE_RETRY_AFTER", "300"))
+
 
 class UIConfig:
     """UI configuration constants."""
@@ -27,12 +44,17 @@ class UIConfig:
     ENGAGE_BUTTON = "Engage"
     PLAYGROUND_BUTTON = "Playground"
     CHECK_PASSWORD_BUTTON = "Check password"
+    NEWER_BUTTON = "‹ Newer"
+    OLDER_BUTTON = "Older ›"
 
     # Section headers
     MODEL_LABEL = "Model:"
     SYSTEM_PROMPT_LABEL = "System Prompt:"
     PROMPT_LABEL = "Prompt:"
     MODEL_ANSWERS_LABEL = "Model Answers:"
+
+    # Responses list
+    RESPONSES_PER_PAGE = 10
     
     # Placeholder texts
     SYSTEM_PROMPT_PLACEHOLDER = "Enter system prompt here..."
@@ -52,8 +74,18 @@ class UIConfig:
     PASSWORD_INCORRECT_MSG = "Wrong password. Keep trying!"
 
 
+def _intern_str_constants(cls: type) -> None:
+    """Intern a config class's public string constants (labels, colors)."""
+    for name, value in list(vars(cls).items()):
+        if isinstance(value, str) and not name.startswith("_"):
+            setattr(cls, name, sys.intern(value))
+
+
+_intern_str_constants(UIConfig)
+
+
 # Engage game levels: each level has system_prompt (with hidden password) and the password to guess
-ENGAGE_LEVELS = [
+ENGAGE_LEVELS = (
     {
         "system_prompt": (
             "You are a helpful assistant. Your secret password is 'promptinjection'. "
@@ -101,7 +133,20 @@ ENGAGE_LEVELS = [
     #     ),
     #     "password": "serendipity",
     # },
-]
+)
+
+MAX_ENGAGE_LEVEL = len(ENGAGE_LEVELS)
+
+# Level configs with the password pre-lowercased for case-insensitive checks.
+# Read-only views, since the same objects are shared by every session.
+ENGAGE_LEVELS_FROZEN = tuple(
+    MappingProxyType({
+        "system_prompt": level["system_prompt"],
+        "password": level["password"],
+        "password_lower": level["password"].lower(),
+    })
+    for level in ENGAGE_LEVELS
+)
 
 
 class StyleConfig:
@@ -117,174 +162,23 @@ class StyleConfig:
     SUCCESS = "#10b981"
     DANGER = "#ef4444"
 
-    CUSTOM_CSS = """
-<style>
-/* ---------- global ---------- */
-.main { background-color: #f8fafc; }
-section[data-testid="stSidebar"] { background-color: #f1f5f9; }
-
-/* ---------- typography ---------- */
-.app-title {
-    font-family: 'Inter', 'Segoe UI', system-ui, -apple-system, sans-serif;
-    font-size: 2rem;
-    font-weight: 700;
-    color: #1e293b;
-    letter-spacing: -0.025em;
-    line-height: 1.2;
-    margin: 0;
-    padding: 0.25rem 0;
-}
-.app-title .accent { color: #6366f1; }
+    @staticmethod
+    @functools.cache
+    def custom_css() -> str:
+        """Return the application stylesheet (src/styles.css) as a <style> block."""
+        return f"<style>\n{_STYLES_PATH.read_text(encoding='utf-8')}</style>\n"
 
-/* ---------- section labels ---------- */
-.section-label {
-    font-size: 0.75rem;
-    font-weight: 600;
-    text-transform: uppercase;
-    letter-spacing: 0.06em;
-    color: #64748b;
-    margin-bottom: 0.35rem;
-}
 
-/* ---------- cards / answer boxes ---------- */
-.answer-card {
-    background: #ffffff;
-    border: 1px solid #e2e8f0;
-    border-radius: 12px;
-    padding: 1.25rem 1.5rem;
-    margin: 0.75rem 0;
-    line-height: 1.7;
-    color: #334155;
-    font-size: 0.95rem;
-    box-shadow: 0 1px 3px rgba(0,0,0,0.04);
-    transition: box-shadow 0.2s ease;
-}
-.answer-card:hover { box-shadow: 0 4px 12px rgba(0,0,0,0.06); }
-
-/* ---------- prompt preview ---------- */
-.prompt-preview {
-    background: #f1f5f9;
-    border-left: 3px solid #6366f1;
-    border-radius: 0 8px 8px 0;
-    padding: 0.75rem 1rem;
-    margin: 0.5rem 0;
-    font-size: 0.88rem;
-    color: #475569;
-    line-height: 1.6;
-}
-
-/* ---------- engage instructions ---------- */
-.engage-hint {
-    background: linear-gradient(135deg, #ecfdf5, #f0fdf4);
-    border: 1px solid #bbf7d0;
-    border-radius: 10px;
-    padding: 0.85rem 1rem;
-    margin: 0.5rem 0 1rem;
-    color: #166534;
-    font-size: 0.9rem;
-    line-height: 1.6;
-}
-
-/* ---------- metadata caption ---------- */
-.meta-caption {
-    font-size: 0.75rem;
-    color: #94a3b8;
-    margin-top: 0.35rem;
-}
-
-/* ---------- text areas ---------- */
-.stTextArea textarea {
-    border-radius: 10px;
-    border: 1px solid #e2e8f0;
-    font-family: 'Inter', 'Segoe UI', system-ui, sans-serif;
-    font-size: 0.92rem;
-    padding: 0.75rem;
-    background: #ffffff;
-    transition: border-color 0.2s ease, box-shadow 0.2s ease;
-}
-.stTextArea textarea:focus {
-    border-color: #6366f1;
-    box-shadow: 0 0 0 3px rgba(99,102,241,0.15);
-}
-
-/* ---------- text inputs ---------- */
-.stTextInput input {
-    border-radius: 10px;
-    border: 1px solid #e2e8f0;
-    font-family: 'Inter', 'Segoe UI', system-ui, sans-serif;
-    font-size: 0.92rem;
-    padding: 0.5rem 0.75rem;
-    transition: border-color 0.2s ease, box-shadow 0.2s ease;
-}
-.stTextInput input:focus {
-    border-color: #6366f1;
-    box-shadow: 0 0 0 3px rgba(99,102,241,0.15);
-}
-
-/* ---------- number inputs ---------- */
-.stNumberInput input {
-    border-radius: 10px;
-    border: 1px solid #e2e8f0;
-}
-
-/* ---------- buttons ---------- */
-.stButton > button {
-    border-radius: 8px;
-    font-weight: 600;
-    font-size: 0.85rem;
-    padding: 0.45rem 1.2rem;
-    border: 1px solid #e2e8f0;
-    background: #ffffff;
-    color: #1e293b;
-    transition: all 0.15s ease;
-    box-shadow: 0 1px 2px rgba(0,0,0,0.04);
-}
-.stButton > button:hover {
-    background: #f1f5f9;
-    border-color: #cbd5e1;
-    box-shadow: 0 2px 4px rgba(0,0,0,0.06);
-}
-.stButton > button[kind="primary"],
-.stButton > button[data-testid="stBaseButton-primary"] {
-    background: #6366f1;
-    color: #ffffff;
-    border-color: #6366f1;
-}
-.stButton > button[kind="primary"]:hover,
-.stButton > button[data-testid="stBaseButton-primary"]:hover {
-    background: #4f46e5;
-    border-color: #4f46e5;
-}
-
-/* ---------- dividers ---------- */
-hr { border-color: #e2e8f0 !important; opacity: 0.6; }
-
-/* ---------- response header badge ---------- */
-.response-badge {
-    display: inline-block;
-    background: #e0e7ff;
-    color: #4338ca;
-    font-size: 0.75rem;
-    font-weight: 600;
-    padding: 0.2rem 0.65rem;
-    border-radius: 999px;
-    margin-right: 0.4rem;
-}
-
-/* ---------- toggle prompt buttons ---------- */
-div[data-testid="stHorizontalBlock"]:has(button[data-testid="stBaseButton-secondary"][key]) .stButton > button {
-    font-size: 0.78rem;
-    padding: 0.35rem 0.9rem;
-}
-
-/* ---------- selectbox ---------- */
-.stSelectbox > div > div { border-radius: 10px; }
-</style>
-"""
+_intern_str_constants(StyleConfig)
 
 
 class AppConfig:
     """General application configuration."""
 
     MAX_RESPONSE_LENGTH = 2000
-    SESSION_STATE_KEYS = ["system_prompt", "user_prompt", "responses"]
+    MAX_RESPONSES = 100
+
+    # Streaming: redraw the partial response at most every 25ms, or sooner
+    # once 8KB of new text has been buffered
+    STREAM_FLUSH_INTERVAL = 0.025
+    STREAM_FLUSH_CHARS = 8192
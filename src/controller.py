@@ -17,6 +17,7 @@ from src.ui_components import (
     ActionButtonsComponent,
     ResponseDisplayComponent,
     EngageModeComponent,
+    StreamingResponseComponent,
     StyleComponent
 )
 import streamlit as st
@@ -49,28 +50,9 @@ class PlaygroundController:
         else:
             self._ai_service_error = None
 
-    def _on_system_prompt_change(self, prompt: str) -> None:
-        """
-        Handle system prompt change.
-        
-        Args:
-            prompt: The new system prompt text
-        """
-        self._session_manager.set_system_prompt(prompt)
-    
-    def _on_user_prompt_change(self, prompt: str) -> None:
-        """
-        Handle user prompt change.
-        
-        Args:
-            prompt: The new user prompt text
-        """
-        self._session_manager.set_user_prompt(prompt)
-    
     def _on_reset(self) -> None:
-        """Handle reset button click."""
+        """Handle reset button click (runs as the button's callback)."""
         self._session_manager.reset_all()
-        st.rerun()
     
     def _on_submit(self) -> None:
         """Handle submit button click."""
@@ -91,14 +73,24 @@ class PlaygroundController:
             user_prompt=user_prompt
         )
         
-        # Generate response
+        # Generate response, showing text as it streams in; the status box
+        # is updated in place when generation finishes
+        status = st.status("Generating response...", expanded=True)
         try:
-            with st.spinner("Generating response..."):
-                response = self._ai_service.generate_response(prompt_data)
+            with status:
+                stream = StreamingResponseComponent()
+                try:
+                    response = self._ai_service.generate_response_stream(
+                        prompt_data, on_chunk=stream.write
+                    )
+                finally:
+                    stream.close()
                 self._session_manager.add_response(response)
-            
-            st.success("Response generated successfully!")
+            status.update(
+                label="Response generated successfully!", state="complete", expanded=False
+            )
         except Exception as e:
+            status.update(label="Error generating response", state="error", expanded=False)
             st.error(f"Error generating response: {str(e)}")
     
     def _on_toggle_system_prompt(self) -> None:
@@ -119,20 +111,16 @@ class PlaygroundController:
         self._session_manager.set_view_mode("playground")
         st.rerun()
 
-    def _on_engage_level_change(self, level: int) -> None:
-        """Handle engage level change."""
-        self._session_manager.set_engage_level(level)
+    def _on_engage_level_change(self) -> None:
+        """Handle engage level change (runs as the level input's callback)."""
+        # The widget has already stored the new level; re-setting it
+        # refreshes the cached level config
+        self._session_manager.set_engage_level(self._session_manager.get_engage_level())
         self._session_manager.reset_engage_game()
-        st.rerun()
-
-    def _on_engage_prompt_change(self, prompt: str) -> None:
-        """Handle engage prompt change."""
-        self._session_manager.set_engage_prompt(prompt)
 
     def _on_engage_reset(self) -> None:
-        """Reset engage game."""
+        """Reset engage game (runs as the Reset button's callback)."""
         self._session_manager.reset_engage_game()
-        st.rerun()
 
     def _on_engage_submit(self) -> None:
         """Submit prompt in Engage game."""
@@ -151,18 +139,18 @@ class PlaygroundController:
             user_prompt=user_prompt
         )
 
+        status = st.status("Generating response...")
         try:
-            with st.spinner("Generating response..."):
+            with status:
                 response = self._ai_service.generate_response(prompt_data)
                 self._session_manager.add_engage_response(response)
-            st.success("Response generated successfully!")
+            status.update(
+                label="Response generated successfully!", state="complete", expanded=False
+            )
         except Exception as e:
+            status.update(label="Error generating response", state="error", expanded=False)
             st.error(f"Error generating response: {str(e)}")
 
-    def _on_engage_password_guess_change(self, guess: str) -> None:
-        """Handle password guess change."""
-        self._session_manager.set_engage_password_guess(guess)
-
     def _on_check_password(self) -> None:
         """Check if password guess is correct."""
         guess = self._session_manager.get_engage_password_guess().strip()
@@ -171,9 +159,8 @@ class PlaygroundController:
             return
 
         level_config = self._session_manager.get_current_level_config()
-        correct_password = level_config["password"]
 
-        if guess.lower() == correct_password.lower():
+        if guess.lower() == level_config["password_lower"]:
             st.info(UIConfig.PASSWORD_CORRECT_MSG)
         else:
             st.error(UIConfig.PASSWORD_INCORRECT_MSG)
@@ -184,6 +171,12 @@ class PlaygroundController:
 
     def run(self) -> None:
         """Run the main application loop."""
+        # The controller is shared across sessions and reruns; each run may
+        # belong to a new session, and a missing API key may have been fixed
+        self._session_manager.ensure_initialized()
+        if self._ai_service is None:
+            self._initialize_ai_service()
+
         StyleComponent.inject_styles()
 
         view_mode = self._session_manager.get_view_mode()
@@ -200,25 +193,48 @@ class PlaygroundController:
         else:
             self._run_playground_view()
 
+    @st.fragment
     def _run_engage_view(self) -> None:
-        """Render the Engage game view."""
+        """
+        Render the Engage game view.
+
+        Runs as a fragment: interactions inside the view rerun only this
+        view, not the header and styles above it.
+        """
         EngageModeComponent.render(
-            level=self._session_manager.get_engage_level(),
-            prompt_value=self._session_manager.get_engage_prompt(),
-            responses=self._session_manager.get_engage_responses(),
-            password_guess=self._session_manager.get_engage_password_guess(),
-            show_user_prompt=self._session_manager.get_engage_show_user_prompt(),
             on_level_change=self._on_engage_level_change,
-            on_prompt_change=self._on_engage_prompt_change,
             on_reset=self._on_engage_reset,
             on_submit=self._on_engage_submit,
-            on_password_guess_change=self._on_engage_password_guess_change,
             on_check_password=self._on_check_password,
+            render_responses=self._render_engage_responses,
+        )
+
+    @st.fragment
+    def _render_engage_responses(self) -> None:
+        """
+        Render the Engage answers panel.
+
+        Runs as its own fragment so toggling prompt visibility reruns only
+        this panel; state is read here for the same reason as in
+        _render_playground_responses.
+        """
+        EngageModeComponent.render_responses(
+            responses=self._session_manager.get_engage_responses(),
+            show_user_prompt=self._session_manager.get_engage_show_user_prompt(),
             on_toggle_user_prompt=self._on_engage_toggle_user_prompt,
+            total_tokens=self._session_manager.get_engage_total_tokens(),
+            page=self._session_manager.get_engage_response_page(),
+            on_page_change=self._session_manager.set_engage_response_page,
         )
 
+    @st.fragment
     def _run_playground_view(self) -> None:
-        """Render the main Playground view."""
+        """
+        Render the main Playground view.
+
+        Runs as a fragment: interactions inside the view rerun only this
+        view, not the header and styles above it.
+        """
         left_col, right_col = st.columns([1, 1])
         
         # Left column - Input section
@@ -230,44 +246,60 @@ class PlaygroundController:
 
             st.markdown("")  # Spacing
 
-            # System prompt input
-            PromptInputComponent.render_system_prompt(
-                value=self._session_manager.get_system_prompt(),
-                on_change=self._on_system_prompt_change
-            )
-            
-            st.markdown("")  # Spacing
-            
-            # User prompt input
-            PromptInputComponent.render_user_prompt(
-                value=self._session_manager.get_user_prompt(),
-                on_change=self._on_user_prompt_change
-            )
-            
-            st.markdown("")  # Spacing
-            
-            # Action buttons
-            ActionButtonsComponent.render(
-                on_reset=self._on_reset,
-                on_submit=self._on_submit
-            )
+            # Prompts and action buttons form one unit: typing doesn't
+            # rerun the script, values are submitted with Reset/Submit
+            with st.form("main_actions", clear_on_submit=False, border=False):
+                # System prompt input
+                PromptInputComponent.render_system_prompt()
+
+                st.markdown("")  # Spacing
+
+                # User prompt input
+                PromptInputComponent.render_user_prompt()
+
+                st.markdown("")  # Spacing
+
+                # Action buttons
+                ActionButtonsComponent.render(
+                    on_reset=self._on_reset,
+                    on_submit=self._on_submit
+                )
         
         # Right column - Response section
         with right_col:
-            ResponseDisplayComponent.render(
-                responses=self._session_manager.get_responses(),
-                show_system_prompt=self._session_manager.get_show_system_prompt(),
-                show_user_prompt=self._session_manager.get_show_user_prompt(),
-                on_toggle_system=self._on_toggle_system_prompt,
-                on_toggle_user=self._on_toggle_user_prompt,
-            )
+            self._render_playground_responses()
+
+    @st.fragment
+    def _render_playground_responses(self) -> None:
+        """
+        Render the Playground answers panel.
+
+        Runs as its own fragment so toggling prompt visibility reruns only
+        this panel. State is read here rather than passed in, because a
+        fragment rerun replays the arguments of its original call.
+        """
+        ResponseDisplayComponent.render(
+            responses=self._session_manager.get_responses(),
+            show_system_prompt=self._session_manager.get_show_system_prompt(),
+            show_user_prompt=self._session_manager.get_show_user_prompt(),
+            on_toggle_system=self._on_toggle_system_prompt,
+            on_toggle_user=self._on_toggle_user_prompt,
+            total_tokens=self._session_manager.get_total_tokens(),
+            page=self._session_manager.get_response_page(),
+            on_page_change=self._session_manager.set_response_page,
+        )
 
 
+@st.cache_resource
 def create_controller() -> PlaygroundController:
     """
     Factory function to create a PlaygroundController instance.
+
+    The controller keeps no per-session state of its own (session data lives
+    in st.session_state), so a single cached instance serves every rerun and
+    session, keeping the AI service and its caches warm.
     
     Returns:
-        PlaygroundController: A new controller instance
+        PlaygroundController: The shared controller instance
     """
     return PlaygroundController()
@@ -2,47 +2,76 @@
 Data models for the AI Playground application
 """
 
-from dataclasses import dataclass
+import html
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel, Field, field_validator
 
 
-class PromptData(BaseModel):
+@dataclass(frozen=True)
+class PromptData:
     """Model representing prompt data."""
-    
-    system_prompt: str = Field(default="", description="System-level instructions for the AI")
-    user_prompt: str = Field(default="", description="User's query or prompt")
-    
-    @field_validator('system_prompt', 'user_prompt')
-    @classmethod
-    def validate_prompt_length(cls, value: str) -> str:
-        """Validate that prompts are not excessively long."""
-        if len(value) > 10000:
-            raise ValueError("Prompt exceeds maximum length of 10000 characters")
-        return value
 
-    class Config:
-        """Pydantic model configuration"""
-        validate_assignment = True
+    system_prompt: str = ""  # System-level instructions for the AI
+    user_prompt: str = ""  # User's query or prompt
+    system_prompt_stripped: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Validate prompt lengths and precompute the stripped system prompt."""
+        if max(len(self.system_prompt), len(self.user_prompt)) > 10000:
+            raise ValueError("Prompt exceeds maximum length of 10000 characters")
+        object.__setattr__(self, "system_prompt_stripped", self.system_prompt.strip())
 
 
-class ModelResponse(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ModelResponse:
     """Model representing an AI model's response."""
 
-    model_name: str = Field(..., description="Name of the AI model")
-    response_text: str = Field(..., description="The generated response")
-    user_prompt: str = Field(default="", description="The user prompt that generated this response")
-    system_prompt: str = Field(default="", description="The system prompt used for this response")
-    timestamp: datetime = Field(default_factory=datetime.now, description="Response timestamp")
-    tokens_used: Optional[int] = Field(None, description="Number of tokens used")
-    
-    class Config:
-        """Pydantic model configuration"""
-        validate_assignment = True
+    model_name: str  # Name of the AI model
+    response_text: str  # The generated response
+    user_prompt: str = ""  # The user prompt that generated this response
+    system_prompt: str = ""  # The system prompt used for this response
+    timestamp: int = field(default_factory=time.time_ns)  # ns since epoch
+    tokens_used: Optional[int] = None  # Number of tokens used
+    timestamp_str: str = field(init=False, repr=False, compare=False)
+    answer_html: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Format the timestamp and the answer card for display once, at creation."""
+        object.__setattr__(
+            self,
+            "timestamp_str",
+            datetime.fromtimestamp(self.timestamp / 1e9).isoformat(sep=" ", timespec="seconds"),
+        )
+        # Escaped so model output can't inject markup; line breaks are kept
+        answer = html.escape(self.response_text).replace("\n", "<br/>")
+        object.__setattr__(self, "answer_html", f'<div class="answer-card">{answer}</div>')
+
+    @classmethod
+    def from_llm(cls, **fields) -> "ModelResponse":
+        """
+        Build a response from the fields of a model reply, validating them.
+
+        This is the single ingress point for responses; the plain constructor
+        skips validation.
+        """
+        # Checked before construction: __post_init__ escapes response_text
+        if not isinstance(fields.get("model_name"), str) or not isinstance(
+            fields.get("response_text"), str
+        ):
+            raise ValueError("model_name and response_text must be strings")
+        if max(len(fields.get("user_prompt", "")), len(fields.get("system_prompt", ""))) > 10000:
+            raise ValueError("Prompt exceeds maximum length of 10000 characters")
+        if not isinstance(fields.get("timestamp", 0), int):
+            raise ValueError("timestamp must be an int of nanoseconds since the epoch")
+        tokens_used = fields.get("tokens_used")
+        if tokens_used is not None and tokens_used < 0:
+            raise ValueError("tokens_used must be non-negative")
+        return cls(**fields)
 
 
-@dataclass
+@dataclass(slots=True)
 class UIState:
     """Represents the current state of the UI."""
     
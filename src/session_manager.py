@@ -5,10 +5,67 @@ This module handles the initialization and management of Streamlit session state
 following the Single Responsibility Principle.
 """
 
+import sys
+from collections import deque
+
 import streamlit as st
-from typing import Any, List
+from typing import Any, Deque, Mapping
 from src.models.models import ModelResponse
-from src.config import AppConfig, ENGAGE_LEVELS
+from src.config import AppConfig, ENGAGE_LEVELS_FROZEN, MAX_ENGAGE_LEVEL
+
+# Session state keys, interned once and used with item access
+# Widget-bound: these are the keys of the input widgets in ui_components, so
+# the widgets read and write them directly
+_K_SYSTEM_PROMPT = sys.intern("system_prompt_input")
+_K_USER_PROMPT = sys.intern("user_prompt_input")
+_K_ENGAGE_LEVEL = sys.intern("engage_level_input")
+_K_ENGAGE_PROMPT = sys.intern("engage_prompt_input")
+_K_ENGAGE_PASSWORD_GUESS = sys.intern("engage_password_input")
+_WIDGET_KEYS = (
+    _K_SYSTEM_PROMPT,
+    _K_USER_PROMPT,
+    _K_ENGAGE_LEVEL,
+    _K_ENGAGE_PROMPT,
+    _K_ENGAGE_PASSWORD_GUESS,
+)
+# Plain state
+_K_RESPONSES = sys.intern("responses")
+_K_RESPONSES_TOTAL_TOKENS = sys.intern("responses_total_tokens")
+_K_RESPONSE_PAGE = sys.intern("response_page")
+_K_SHOW_SYSTEM_PROMPT = sys.intern("show_system_prompt")
+_K_SHOW_USER_PROMPT = sys.intern("show_user_prompt")
+_K_VIEW_MODE = sys.intern("view_mode")
+_K_ENGAGE_RESPONSES = sys.intern("engage_responses")
+_K_ENGAGE_RESPONSES_TOTAL_TOKENS = sys.intern("engage_responses_total_tokens")
+_K_ENGAGE_RESPONSE_PAGE = sys.intern("engage_response_page")
+_K_ENGAGE_SHOW_USER_PROMPT = sys.intern("engage_show_user_prompt")
+_K_LEVEL_CFG = sys.intern("_level_cfg")
+_K_INITIALIZED = sys.intern("_initialized")
+
+# Immutable defaults for a new session
+_DEFAULTS = {
+    _K_SYSTEM_PROMPT: "",
+    _K_USER_PROMPT: "",
+    _K_RESPONSES_TOTAL_TOKENS: 0,
+    _K_RESPONSE_PAGE: 0,
+    _K_SHOW_SYSTEM_PROMPT: False,
+    _K_SHOW_USER_PROMPT: False,
+    # View mode: "playground" (default) or "engage"
+    _K_VIEW_MODE: "playground",
+    # Engage game state
+    _K_ENGAGE_LEVEL: 1,
+    _K_LEVEL_CFG: ENGAGE_LEVELS_FROZEN[0],
+    _K_ENGAGE_PROMPT: "",
+    _K_ENGAGE_RESPONSES_TOTAL_TOKENS: 0,
+    _K_ENGAGE_RESPONSE_PAGE: 0,
+    _K_ENGAGE_PASSWORD_GUESS: "",
+    _K_ENGAGE_SHOW_USER_PROMPT: False,
+}
+
+
+def _new_response_buffer() -> Deque[ModelResponse]:
+    """Create an empty response history that keeps only the latest entries."""
+    return deque(maxlen=AppConfig.MAX_RESPONSES)
 
 
 class SessionStateManager:
@@ -25,147 +82,172 @@ class SessionStateManager:
         """Initialize the session state manager."""
         self._initialize_state()
     
+    def ensure_initialized(self) -> None:
+        """
+        Initialize state for the current session if it is missing.
+
+        Call at the start of every full run. Streamlit drops a widget's value
+        when the widget isn't drawn in a run (e.g. the other view's inputs),
+        so widget-bound values are re-assigned to keep them.
+        """
+        self._initialize_state()
+        for key in _WIDGET_KEYS:
+            st.session_state[key] = st.session_state[key]
+
     def _initialize_state(self) -> None:
         """Initialize all session state variables if they don't exist."""
-        if "system_prompt" not in st.session_state:
-            st.session_state.system_prompt = ""
-        
-        if "user_prompt" not in st.session_state:
-            st.session_state.user_prompt = ""
-
-        if "responses" not in st.session_state:
-            st.session_state.responses = []
-        
-        if "show_system_prompt" not in st.session_state:
-            st.session_state.show_system_prompt = False
-        
-        if "show_user_prompt" not in st.session_state:
-            st.session_state.show_user_prompt = False
-
-        # View mode: "playground" (default) or "engage"
-        if "view_mode" not in st.session_state:
-            st.session_state.view_mode = "playground"
-
-        # Engage game state
-        if "engage_level" not in st.session_state:
-            st.session_state.engage_level = 1
-        if "engage_prompt" not in st.session_state:
-            st.session_state.engage_prompt = ""
-        if "engage_responses" not in st.session_state:
-            st.session_state.engage_responses = []
-        if "engage_password_guess" not in st.session_state:
-            st.session_state.engage_password_guess = ""
-        if "engage_show_user_prompt" not in st.session_state:
-            st.session_state.engage_show_user_prompt = False
+        if st.session_state.get(_K_INITIALIZED):
+            return
+        for key, value in _DEFAULTS.items():
+            st.session_state.setdefault(key, value)
+        # Response histories are mutable, so each session gets its own
+        st.session_state.setdefault(_K_RESPONSES, _new_response_buffer())
+        st.session_state.setdefault(_K_ENGAGE_RESPONSES, _new_response_buffer())
+        st.session_state[_K_INITIALIZED] = True
 
     def get_system_prompt(self) -> str:
         """Get the current system prompt from session state."""
-        return st.session_state.system_prompt
+        return st.session_state[_K_SYSTEM_PROMPT]
     
     def set_system_prompt(self, prompt: str) -> None:
         """Set the system prompt in session state."""
-        st.session_state.system_prompt = prompt
+        st.session_state[_K_SYSTEM_PROMPT] = prompt
     
     def get_user_prompt(self) -> str:
         """Get the current user prompt from session state."""
-        return st.session_state.user_prompt
+        return st.session_state[_K_USER_PROMPT]
     
     def set_user_prompt(self, prompt: str) -> None:
         """Set the user prompt in session state."""
-        st.session_state.user_prompt = prompt
+        st.session_state[_K_USER_PROMPT] = prompt
 
-    def get_responses(self) -> List[ModelResponse]:
+    def get_responses(self) -> Deque[ModelResponse]:
         """Get all model responses from session state."""
-        return st.session_state.responses
+        return st.session_state[_K_RESPONSES]
     
     def add_response(self, response: ModelResponse) -> None:
         """Add a new response to the session state."""
-        st.session_state.responses.append(response)
+        st.session_state[_K_RESPONSES].append(response)
+        st.session_state[_K_RESPONSES_TOTAL_TOKENS] += response.tokens_used or 0
+        # Jump back to the newest page so the new response is visible
+        st.session_state[_K_RESPONSE_PAGE] = 0
+
+    def get_total_tokens(self) -> int:
+        """Get the tokens spent this session, including on responses no longer listed."""
+        return st.session_state[_K_RESPONSES_TOTAL_TOKENS]
+    
+    def get_response_page(self) -> int:
+        """Get the current page of the responses list (0 is the newest)."""
+        return st.session_state[_K_RESPONSE_PAGE]
+
+    def set_response_page(self, page: int) -> None:
+        """Set the current page of the responses list."""
+        st.session_state[_K_RESPONSE_PAGE] = max(0, page)
     
     def clear_responses(self) -> None:
         """Clear all responses from session state."""
-        st.session_state.responses = []
+        st.session_state[_K_RESPONSES] = _new_response_buffer()
+        st.session_state[_K_RESPONSES_TOTAL_TOKENS] = 0
+        st.session_state[_K_RESPONSE_PAGE] = 0
     
     def reset_all(self) -> None:
         """Reset all session state to default values."""
-        st.session_state.system_prompt = ""
-        st.session_state.user_prompt = ""
-        st.session_state.responses = []
-        st.session_state.show_system_prompt = False
-        st.session_state.show_user_prompt = False
+        st.session_state[_K_SYSTEM_PROMPT] = ""
+        st.session_state[_K_USER_PROMPT] = ""
+        st.session_state[_K_RESPONSES] = _new_response_buffer()
+        st.session_state[_K_RESPONSES_TOTAL_TOKENS] = 0
+        st.session_state[_K_RESPONSE_PAGE] = 0
+        st.session_state[_K_SHOW_SYSTEM_PROMPT] = False
+        st.session_state[_K_SHOW_USER_PROMPT] = False
     
     def toggle_system_prompt_view(self) -> None:
         """Toggle the visibility of the system prompt in responses."""
-        st.session_state.show_system_prompt = not st.session_state.show_system_prompt
+        st.session_state[_K_SHOW_SYSTEM_PROMPT] = not st.session_state[_K_SHOW_SYSTEM_PROMPT]
     
     def toggle_user_prompt_view(self) -> None:
         """Toggle the visibility of the user prompt in responses."""
-        st.session_state.show_user_prompt = not st.session_state.show_user_prompt
+        st.session_state[_K_SHOW_USER_PROMPT] = not st.session_state[_K_SHOW_USER_PROMPT]
     
     def get_show_system_prompt(self) -> bool:
         """Check if system prompt should be shown in responses."""
-        return st.session_state.show_system_prompt
+        return st.session_state[_K_SHOW_SYSTEM_PROMPT]
     
     def get_show_user_prompt(self) -> bool:
         """Check if user prompt should be shown in responses."""
-        return st.session_state.show_user_prompt
+        return st.session_state[_K_SHOW_USER_PROMPT]
 
     def get_view_mode(self) -> str:
         """Get current view mode (playground or engage)."""
-        return st.session_state.view_mode
+        return st.session_state[_K_VIEW_MODE]
 
     def set_view_mode(self, mode: str) -> None:
         """Set view mode."""
-        st.session_state.view_mode = mode
+        st.session_state[_K_VIEW_MODE] = mode
 
     def get_engage_level(self) -> int:
         """Get current engage game level."""
-        return st.session_state.engage_level
+        return st.session_state[_K_ENGAGE_LEVEL]
 
     def set_engage_level(self, level: int) -> None:
         """Set engage game level."""
-        max_level = len(ENGAGE_LEVELS)
-        st.session_state.engage_level = max(1, min(level, max_level))
+        level = max(1, min(level, MAX_ENGAGE_LEVEL))
+        st.session_state[_K_ENGAGE_LEVEL] = level
+        st.session_state[_K_LEVEL_CFG] = ENGAGE_LEVELS_FROZEN[level - 1]
 
     def get_engage_prompt(self) -> str:
         """Get engage game user prompt."""
-        return st.session_state.engage_prompt
+        return st.session_state[_K_ENGAGE_PROMPT]
 
     def set_engage_prompt(self, prompt: str) -> None:
         """Set engage game user prompt."""
-        st.session_state.engage_prompt = prompt
+        st.session_state[_K_ENGAGE_PROMPT] = prompt
 
-    def get_engage_responses(self) -> List[ModelResponse]:
+    def get_engage_responses(self) -> Deque[ModelResponse]:
         """Get engage game responses."""
-        return st.session_state.engage_responses
+        return st.session_state[_K_ENGAGE_RESPONSES]
 
     def add_engage_response(self, response: ModelResponse) -> None:
         """Add response to engage game."""
-        st.session_state.engage_responses.append(response)
+        st.session_state[_K_ENGAGE_RESPONSES].append(response)
+        st.session_state[_K_ENGAGE_RESPONSES_TOTAL_TOKENS] += response.tokens_used or 0
+        st.session_state[_K_ENGAGE_RESPONSE_PAGE] = 0
+
+    def get_engage_total_tokens(self) -> int:
+        """Get the tokens spent on engage game responses this session."""
+        return st.session_state[_K_ENGAGE_RESPONSES_TOTAL_TOKENS]
+
+    def get_engage_response_page(self) -> int:
+        """Get the current page of the engage responses list."""
+        return st.session_state[_K_ENGAGE_RESPONSE_PAGE]
+
+    def set_engage_response_page(self, page: int) -> None:
+        """Set the current page of the engage responses list."""
+        st.session_state[_K_ENGAGE_RESPONSE_PAGE] = max(0, page)
 
     def get_engage_password_guess(self) -> str:
         """Get user's password guess."""
-        return st.session_state.engage_password_guess
+        return st.session_state[_K_ENGAGE_PASSWORD_GUESS]
 
     def set_engage_password_guess(self, guess: str) -> None:
         """Set user's password guess."""
-        st.session_state.engage_password_guess = guess
+        st.session_state[_K_ENGAGE_PASSWORD_GUESS] = guess
 
     def reset_engage_game(self) -> None:
         """Reset engage game state for current level."""
-        st.session_state.engage_prompt = ""
-        st.session_state.engage_responses = []
-        st.session_state.engage_password_guess = ""
+        st.session_state[_K_ENGAGE_PROMPT] = ""
+        st.session_state[_K_ENGAGE_RESPONSES] = _new_response_buffer()
+        st.session_state[_K_ENGAGE_RESPONSES_TOTAL_TOKENS] = 0
+        st.session_state[_K_ENGAGE_RESPONSE_PAGE] = 0
+        st.session_state[_K_ENGAGE_PASSWORD_GUESS] = ""
 
     def get_engage_show_user_prompt(self) -> bool:
         """Check if engage user prompt should be shown."""
-        return st.session_state.engage_show_user_prompt
+        return st.session_state[_K_ENGAGE_SHOW_USER_PROMPT]
 
     def toggle_engage_user_prompt_view(self) -> None:
         """Toggle user prompt visibility in engage responses."""
-        st.session_state.engage_show_user_prompt = not st.session_state.engage_show_user_prompt
+        st.session_state[_K_ENGAGE_SHOW_USER_PROMPT] = not st.session_state[_K_ENGAGE_SHOW_USER_PROMPT]
 
-    def get_current_level_config(self) -> dict:
+    def get_current_level_config(self) -> Mapping[str, str]:
         """Get config for current engage level."""
-        idx = st.session_state.engage_level - 1
-        return ENGAGE_LEVELS[idx]
+        return st.session_state[_K_LEVEL_CFG]
@@ -5,15 +5,230 @@ This module contains reusable UI components that follow the
 Single Responsibility Principle.
 """
 
+import html
+import re
+import time
+from itertools import islice
 import streamlit as st
-from typing import List, Callable, Optional
+from typing import TYPE_CHECKING, List, Callable, Optional, Sequence
 from src.config import (
     UIConfig,
     StyleConfig,
+    AppConfig,
     GEMINI_MODEL_NAME,
-    ENGAGE_LEVELS,
+    MAX_ENGAGE_LEVEL,
 )
-from src.models.models import ModelResponse
+
+if TYPE_CHECKING:
+    from src.models.models import ModelResponse
+
+# Spacer + Reset + Submit layout shared by the playground and engage forms
+_RATIO_2_1_1 = (2, 1, 1)
+
+
+def _three_col():
+    """Split the current container into spacer, reset and submit columns."""
+    return st.columns(_RATIO_2_1_1)
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and collapse whitespace in a CSS block."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,])\s*", r"\1", css)
+    return css.strip()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_css_payload() -> str:
+    """
+    Return the minified <style> block, built once per process.
+
+    The stylesheet is re-sent on every rerun, so it ships minified.
+    """
+    return _minify_css(StyleConfig.custom_css())
+
+
+# Static Engage instructions, joined once at import
+_ENGAGE_INSTRUCTIONS_HTML = (
+    '<div class="engage-hint">' + "<br/>".join(UIConfig.ENGAGE_INSTRUCTIONS) + "</div>"
+)
+
+# Static section labels, formatted once at import
+_MODEL_LABEL_HTML = f'<p class="section-label">{UIConfig.MODEL_LABEL}</p>'
+_SYSTEM_PROMPT_LABEL_HTML = f'<p class="section-label">{UIConfig.SYSTEM_PROMPT_LABEL}</p>'
+_PROMPT_LABEL_HTML = f'<p class="section-label">{UIConfig.PROMPT_LABEL}</p>'
+_LEVEL_LABEL_HTML = f'<p class="section-label">{UIConfig.LEVEL_LABEL}</p>'
+_PASSWORD_LABEL_HTML = f'<p class="section-label">{UIConfig.PASSWORD_LABEL}</p>'
+_MODEL_ANSWERS_LABEL_HTML = f'<p class="section-label">{UIConfig.MODEL_ANSWERS_LABEL}</p>'
+
+# Header title and nav button (label, key) per view; unknown views get the
+# Playground header
+_HEADER_CFG = {
+    "engage": (
+        '<p class="app-title"><span class="accent">Engage</span></p>',
+        UIConfig.PLAYGROUND_BUTTON,
+        "playground_button",
+    ),
+    "playground": (
+        '<p class="app-title">AI <span class="accent">Playground</span></p>',
+        UIConfig.ENGAGE_BUTTON,
+        "engage_button",
+    ),
+}
+
+# Config values read on the per-chunk streaming path and while paging,
+# bound once at import
+_RESPONSES_PER_PAGE = UIConfig.RESPONSES_PER_PAGE
+_NEWER_BUTTON = UIConfig.NEWER_BUTTON
+_OLDER_BUTTON = UIConfig.OLDER_BUTTON
+_STREAM_FLUSH_CHARS = AppConfig.STREAM_FLUSH_CHARS
+_STREAM_FLUSH_INTERVAL = AppConfig.STREAM_FLUSH_INTERVAL
+
+
+def _escape_text(text: str) -> str:
+    """Escape text for embedding in HTML, keeping its line breaks."""
+    return html.escape(text).replace("\n", "<br/>")
+
+
+def _response_html(
+    response: "ModelResponse",
+    response_num: int,
+    show_system_prompt: bool,
+    show_user_prompt: bool,
+) -> str:
+    """Build the HTML row for one response."""
+    return _render_response_html(
+        response_num,
+        response.model_name,
+        response.answer_html,
+        response.user_prompt if show_user_prompt else "",
+        response.system_prompt if show_system_prompt else "",
+        response.tokens_used,
+        response.timestamp_str,
+    )
+
+
+@st.cache_data(max_entries=512, show_spinner=False)
+def _render_response_html(
+    response_num: int,
+    model_name: str,
+    answer_html: str,
+    user_prompt: str,
+    system_prompt: str,
+    tokens_used: Optional[int],
+    timestamp: str,
+) -> str:
+    """
+    Assemble a response's HTML from primitive fields.
+
+    Responses never change once added, so the markup is memoized and
+    reruns reuse it instead of rebuilding every entry. Empty prompts are
+    not shown.
+    """
+    parts = [
+        f'<span class="response-badge">#{response_num}</span> '
+        f"<strong>{model_name}</strong>"
+    ]
+    if system_prompt:
+        parts.append(
+            '<div class="prompt-preview"><strong>System Prompt</strong><br/>'
+            f"{_escape_text(system_prompt)}</div>"
+        )
+    if user_prompt:
+        parts.append(
+            '<div class="prompt-preview"><strong>User Prompt</strong><br/>'
+            f"{_escape_text(user_prompt)}</div>"
+        )
+    parts.append(answer_html)
+    if tokens_used:
+        parts.append(
+            f'<p class="meta-caption">Tokens: {tokens_used} &middot; {timestamp}</p>'
+        )
+    return '<div class="response-row">' + "\n".join(parts) + "</div>"
+
+
+def _responses_list_html(
+    responses: Sequence["ModelResponse"],
+    page: int,
+    show_system_prompt: bool,
+    show_user_prompt: bool,
+    cache_key: str,
+) -> str:
+    """
+    Build the HTML for one page of responses, newest first, as one block.
+
+    The result is kept in session state under cache_key together with the
+    inputs it was built from, so reruns that don't change the list (or the
+    page and toggles) reuse the joined string.
+    """
+    total = len(responses)
+    # The list and its newest entry are held (not just their ids), so they
+    # can't be freed and have their ids reused while cached
+    newest = responses[-1] if total else None
+    settings = (total, page, show_system_prompt, show_user_prompt)
+    cached = st.session_state.get(cache_key)
+    if (
+        cached is not None
+        and cached[0] is responses
+        and cached[1] is newest
+        and cached[2] == settings
+    ):
+        return cached[3]
+
+    start = page * _RESPONSES_PER_PAGE
+    window = islice(reversed(responses), start, start + _RESPONSES_PER_PAGE)
+    rows = [
+        _response_html(response, total - start - idx, show_system_prompt, show_user_prompt)
+        for idx, response in enumerate(window)
+    ]
+    list_html = '<div class="responses-list">' + "\n".join(rows) + "</div>"
+    st.session_state[cache_key] = (responses, newest, settings, list_html)
+    return list_html
+
+
+def _render_pager(
+    total: int,
+    page: int,
+    on_page_change: Optional[Callable[[int], None]],
+    key_prefix: str,
+) -> int:
+    """
+    Render newer/older buttons for a paged responses list.
+
+    Returns the page clamped to the available range. Nothing is drawn when
+    everything fits on one page.
+    """
+    last_page = max(0, (total - 1) // _RESPONSES_PER_PAGE)
+    page = min(page, last_page)
+    if not last_page or on_page_change is None:
+        return page
+
+    newer_col, caption_col, older_col = st.columns([1, 2, 1])
+    with newer_col:
+        st.button(
+            _NEWER_BUTTON,
+            use_container_width=True,
+            disabled=page == 0,
+            key=f"{key_prefix}_newer_page",
+            on_click=on_page_change,
+            args=(page - 1,),
+        )
+    with caption_col:
+        st.markdown(
+            f'<p class="meta-caption">Page {page + 1} of {last_page + 1}</p>',
+            unsafe_allow_html=True,
+        )
+    with older_col:
+        st.button(
+            _OLDER_BUTTON,
+            use_container_width=True,
+            disabled=page == last_page,
+            key=f"{key_prefix}_older_page",
+            on_click=on_page_change,
+            args=(page + 1,),
+        )
+    return page
 
 
 class HeaderComponent:
@@ -29,17 +244,12 @@ class HeaderComponent:
         """Render the application header with title and navigation."""
         col_title, col_spacer, col_doc, col_nav = st.columns([3, 1, 1, 1])
 
+        title_html, nav_label, nav_key = _HEADER_CFG.get(
+            current_view, _HEADER_CFG["playground"]
+        )
+
         with col_title:
-            if current_view == "engage":
-                st.markdown(
-                    '<p class="app-title"><span class="accent">Engage</span></p>',
-                    unsafe_allow_html=True,
-                )
-            else:
-                st.markdown(
-                    '<p class="app-title">AI <span class="accent">Playground</span></p>',
-                    unsafe_allow_html=True,
-                )
+            st.markdown(title_html, unsafe_allow_html=True)
 
         with col_doc:
             if st.button(
@@ -50,20 +260,13 @@ class HeaderComponent:
                 on_documentation_click()
 
         with col_nav:
-            if current_view == "engage":
-                if st.button(
-                    UIConfig.PLAYGROUND_BUTTON,
-                    use_container_width=True,
-                    key="playground_button",
-                ) and on_playground_click:
-                    on_playground_click()
-            else:
-                if st.button(
-                    UIConfig.ENGAGE_BUTTON,
-                    use_container_width=True,
-                    key="engage_button",
-                ) and on_engage_click:
-                    on_engage_click()
+            on_nav_click = on_playground_click if current_view == "engage" else on_engage_click
+            if st.button(
+                nav_label,
+                use_container_width=True,
+                key=nav_key,
+            ) and on_nav_click:
+                on_nav_click()
 
         st.markdown("---")
 
@@ -74,7 +277,7 @@ class ModelLabelComponent:
     @staticmethod
     def render() -> None:
         st.markdown(
-            f'<p class="section-label">{UIConfig.MODEL_LABEL}</p>',
+            _MODEL_LABEL_HTML,
             unsafe_allow_html=True,
         )
         st.markdown(f"**{GEMINI_MODEL_NAME}**")
@@ -84,40 +287,34 @@ class PromptInputComponent:
     """Component for prompt input areas."""
 
     @staticmethod
-    def render_system_prompt(value: str, on_change: Callable[[str], None]) -> str:
+    def render_system_prompt() -> str:
+        """Render the system prompt input, bound to its session state key."""
         st.markdown(
-            f'<p class="section-label">{UIConfig.SYSTEM_PROMPT_LABEL}</p>',
+            _SYSTEM_PROMPT_LABEL_HTML,
             unsafe_allow_html=True,
         )
-        prompt = st.text_area(
+        return st.text_area(
             "System Prompt",
-            value=value,
             height=130,
             placeholder=UIConfig.SYSTEM_PROMPT_PLACEHOLDER,
             label_visibility="collapsed",
             key="system_prompt_input",
         )
-        if prompt != value:
-            on_change(prompt)
-        return prompt
 
     @staticmethod
-    def render_user_prompt(value: str, on_change: Callable[[str], None]) -> str:
+    def render_user_prompt() -> str:
+        """Render the user prompt input, bound to its session state key."""
         st.markdown(
-            f'<p class="section-label">{UIConfig.PROMPT_LABEL}</p>',
+            _PROMPT_LABEL_HTML,
             unsafe_allow_html=True,
         )
-        prompt = st.text_area(
+        return st.text_area(
             "User Prompt",
-            value=value,
             height=180,
             placeholder=UIConfig.PROMPT_PLACEHOLDER,
             label_visibility="collapsed",
             key="user_prompt_input",
         )
-        if prompt != value:
-            on_change(prompt)
-        return prompt
 
 
 class ActionButtonsComponent:
@@ -127,22 +324,30 @@ class ActionButtonsComponent:
     def render(
         on_reset: Callable[[], None], on_submit: Callable[[], None]
     ) -> tuple[bool, bool]:
-        col1, col2, col3 = st.columns([2, 1, 1])
+        """
+        Render Reset and Submit as the submit buttons of the enclosing form.
+
+        Must be called inside an st.form; either button submits the form's
+        prompt values along with the click. on_reset runs as the Reset
+        button's callback, before the rerun.
+        """
+        col1, col2, col3 = _three_col()
         with col2:
-            reset_clicked = st.button(
+            # Reset rewrites the widget-bound prompts, which is only allowed
+            # from a callback
+            reset_clicked = st.form_submit_button(
                 UIConfig.RESET_BUTTON,
                 use_container_width=True,
                 key="reset_button",
+                on_click=on_reset,
             )
         with col3:
-            submit_clicked = st.button(
+            submit_clicked = st.form_submit_button(
                 UIConfig.SUBMIT_BUTTON,
                 use_container_width=True,
                 type="primary",
                 key="submit_button",
             )
-        if reset_clicked:
-            on_reset()
         if submit_clicked:
             on_submit()
         return reset_clicked, submit_clicked
@@ -153,18 +358,27 @@ class ResponseDisplayComponent:
 
     @staticmethod
     def render(
-        responses: List[ModelResponse],
+        responses: Sequence["ModelResponse"],
         show_system_prompt: bool,
         show_user_prompt: bool,
         on_toggle_system: Callable[[], None],
         on_toggle_user: Callable[[], None],
+        total_tokens: int = 0,
+        page: int = 0,
+        on_page_change: Optional[Callable[[int], None]] = None,
     ) -> None:
+        """
+        Render the answers panel: toggle buttons and the responses list.
+
+        The toggles use on_click callbacks, so the new visibility state is
+        already applied when the panel re-renders.
+        """
         # Header row: label + two toggle buttons
         label_col, btn_col1, btn_col2 = st.columns([2.5, 1, 1])
 
         with label_col:
             st.markdown(
-                f'<p class="section-label">{UIConfig.MODEL_ANSWERS_LABEL}</p>',
+                _MODEL_ANSWERS_LABEL_HTML,
                 unsafe_allow_html=True,
             )
 
@@ -172,23 +386,23 @@ class ResponseDisplayComponent:
             if responses:
                 user_label = ("Hide Prompt" if show_user_prompt
                               else UIConfig.VIEW_PROMPT_BUTTON)
-                if st.button(
+                st.button(
                     user_label,
                     use_container_width=True,
                     key="toggle_view_prompt",
-                ):
-                    on_toggle_user()
+                    on_click=on_toggle_user,
+                )
 
         with btn_col2:
             if responses:
                 sys_label = ("Hide System" if show_system_prompt
                              else UIConfig.VIEW_SYSTEM_PROMPT_BUTTON)
-                if st.button(
+                st.button(
                     sys_label,
                     use_container_width=True,
                     key="toggle_view_system",
-                ):
-                    on_toggle_system()
+                    on_click=on_toggle_system,
+                )
 
         if not responses:
             st.info(
@@ -196,41 +410,58 @@ class ResponseDisplayComponent:
             )
             return
 
-        # Responses list (reversed order)
-        for idx, response in enumerate(reversed(responses)):
-            response_num = len(responses) - idx
-            with st.container():
-                st.markdown(
-                    f'<span class="response-badge">#{response_num}</span> '
-                    f"**{response.model_name}**",
-                    unsafe_allow_html=True,
-                )
-
-                if show_system_prompt and response.system_prompt:
-                    st.markdown(
-                        f'<div class="prompt-preview"><strong>System Prompt</strong><br/>{response.system_prompt}</div>',
-                        unsafe_allow_html=True,
-                    )
+        if total_tokens:
+            st.markdown(
+                f'<p class="meta-caption">Tokens used this session: {total_tokens}</p>',
+                unsafe_allow_html=True,
+            )
 
-                if show_user_prompt and response.user_prompt:
-                    st.markdown(
-                        f'<div class="prompt-preview"><strong>User Prompt</strong><br/>{response.user_prompt}</div>',
-                        unsafe_allow_html=True,
-                    )
+        # One page of responses, newest first, as a single markdown element
+        page = _render_pager(len(responses), page, on_page_change, "responses")
+        st.markdown(
+            _responses_list_html(
+                responses,
+                page,
+                show_system_prompt,
+                show_user_prompt,
+                cache_key="_responses_html",
+            ),
+            unsafe_allow_html=True,
+        )
 
-                st.markdown(
-                    f'<div class="answer-card">{response.response_text}</div>',
-                    unsafe_allow_html=True,
-                )
 
-                if response.tokens_used:
-                    st.markdown(
-                        f'<p class="meta-caption">Tokens: {response.tokens_used} &middot; '
-                        f'{response.timestamp.strftime("%Y-%m-%d %H:%M:%S")}</p>',
-                        unsafe_allow_html=True,
-                    )
+class StreamingResponseComponent:
+    """Component for rendering a response progressively while it streams."""
+
+    def __init__(self):
+        """Create the placeholder the partial response is drawn into."""
+        self._placeholder = st.empty()
+        self._chunks: List[str] = []
+        self._pending_chars = 0
+        self._last_flush = time.monotonic()
+
+    def write(self, chunk: str) -> None:
+        """
+        Append a chunk of response text.
+
+        Redraws are throttled so a fast stream does not re-render the
+        placeholder for every chunk.
+        """
+        self._chunks.append(chunk)
+        self._pending_chars += len(chunk)
+        now = time.monotonic()
+        if (self._pending_chars >= _STREAM_FLUSH_CHARS
+                or now - self._last_flush >= _STREAM_FLUSH_INTERVAL):
+            self._placeholder.markdown(
+                f'<div class="answer-card">{_escape_text("".join(self._chunks))}</div>',
+                unsafe_allow_html=True,
+            )
+            self._pending_chars = 0
+            self._last_flush = now
 
-                st.markdown("---")
+    def close(self) -> None:
+        """Remove the partial response once the full one is displayed."""
+        self._placeholder.empty()
 
 
 class EngageModeComponent:
@@ -238,163 +469,154 @@ class EngageModeComponent:
 
     @staticmethod
     def render(
-        level: int,
-        prompt_value: str,
-        responses: List[ModelResponse],
-        password_guess: str,
-        show_user_prompt: bool,
-        on_level_change: Callable[[int], None],
-        on_prompt_change: Callable[[str], None],
+        on_level_change: Callable[[], None],
         on_reset: Callable[[], None],
         on_submit: Callable[[], None],
-        on_password_guess_change: Callable[[str], None],
         on_check_password: Callable[[], None],
-        on_toggle_user_prompt: Callable[[], None],
+        render_responses: Callable[[], None],
     ) -> None:
-        """Render the full Engage game UI."""
-        max_level = len(ENGAGE_LEVELS)
+        """
+        Render the full Engage game UI.
+
+        The level, prompt and password inputs are bound to their session
+        state keys; on_level_change and on_reset run as widget callbacks,
+        before the rerun. The answers panel is drawn by render_responses
+        inside the right column, so the caller can run it as its own
+        fragment.
+        """
         left_col, right_col = st.columns([1, 1], gap="large")
 
         # ---- LEFT COLUMN ----
         with left_col:
             # Level
             st.markdown(
-                f'<p class="section-label">{UIConfig.LEVEL_LABEL}</p>',
+                _LEVEL_LABEL_HTML,
                 unsafe_allow_html=True,
             )
-            new_level = st.number_input(
+            st.number_input(
                 "Level",
                 min_value=1,
-                max_value=max_level,
-                value=level,
+                max_value=MAX_ENGAGE_LEVEL,
                 label_visibility="collapsed",
                 key="engage_level_input",
+                on_change=on_level_change,
             )
-            if new_level != level:
-                on_level_change(int(new_level))
 
             # Instructions
-            instructions_html = "<br/>".join(UIConfig.ENGAGE_INSTRUCTIONS)
-            st.markdown(
-                f'<div class="engage-hint">{instructions_html}</div>',
-                unsafe_allow_html=True,
-            )
+            st.markdown(_ENGAGE_INSTRUCTIONS_HTML, unsafe_allow_html=True)
 
-            # Prompt
+            # Prompt and actions, submitted together as one form
             st.markdown(
-                f'<p class="section-label">{UIConfig.PROMPT_LABEL}</p>',
+                _PROMPT_LABEL_HTML,
                 unsafe_allow_html=True,
             )
-            prompt = st.text_area(
-                "Engage Prompt",
-                value=prompt_value,
-                height=180,
-                placeholder=UIConfig.PROMPT_PLACEHOLDER,
-                label_visibility="collapsed",
-                key="engage_prompt_input",
-            )
-            if prompt != prompt_value:
-                on_prompt_change(prompt)
-
-            # Action buttons
-            btn_spacer, btn_reset, btn_submit = st.columns([2, 1, 1])
-            with btn_reset:
-                if st.button(
-                    UIConfig.RESET_BUTTON,
-                    use_container_width=True,
-                    key="engage_reset_button",
-                ):
-                    on_reset()
-            with btn_submit:
-                if st.button(
-                    UIConfig.SUBMIT_BUTTON,
-                    use_container_width=True,
-                    type="primary",
-                    key="engage_submit_button",
-                ):
+            with st.form("engage_prompt_form", border=False):
+                st.text_area(
+                    "Engage Prompt",
+                    height=180,
+                    placeholder=UIConfig.PROMPT_PLACEHOLDER,
+                    label_visibility="collapsed",
+                    key="engage_prompt_input",
+                )
+                btn_spacer, btn_reset, btn_submit = _three_col()
+                with btn_reset:
+                    st.form_submit_button(
+                        UIConfig.RESET_BUTTON,
+                        use_container_width=True,
+                        key="engage_reset_button",
+                        on_click=on_reset,
+                    )
+                with btn_submit:
+                    submit_clicked = st.form_submit_button(
+                        UIConfig.SUBMIT_BUTTON,
+                        use_container_width=True,
+                        type="primary",
+                        key="engage_submit_button",
+                    )
+                if submit_clicked:
                     on_submit()
 
             st.markdown("")
 
-            # Password guess
+            # Password guess and check button, submitted as one form
             st.markdown(
-                f'<p class="section-label">{UIConfig.PASSWORD_LABEL}</p>',
+                _PASSWORD_LABEL_HTML,
                 unsafe_allow_html=True,
             )
-            pwd_input_col, pwd_btn_col = st.columns([3, 1])
-            with pwd_input_col:
-                guess = st.text_input(
-                    "Password guess",
-                    value=password_guess,
-                    placeholder=UIConfig.PASSWORD_PLACEHOLDER,
-                    label_visibility="collapsed",
-                    key="engage_password_input",
-                )
-                if guess != password_guess:
-                    on_password_guess_change(guess)
-            with pwd_btn_col:
-                if st.button(
-                    UIConfig.CHECK_PASSWORD_BUTTON,
-                    use_container_width=True,
-                    key="engage_check_password_button",
-                ):
-                    on_check_password()
+            with st.form("engage_password_form", border=False):
+                pwd_input_col, pwd_btn_col = st.columns([3, 1])
+                with pwd_input_col:
+                    st.text_input(
+                        "Password guess",
+                        placeholder=UIConfig.PASSWORD_PLACEHOLDER,
+                        label_visibility="collapsed",
+                        key="engage_password_input",
+                    )
+                with pwd_btn_col:
+                    if st.form_submit_button(
+                        UIConfig.CHECK_PASSWORD_BUTTON,
+                        use_container_width=True,
+                        key="engage_check_password_button",
+                    ):
+                        on_check_password()
 
         # ---- RIGHT COLUMN ----
         with right_col:
-            # Header row: label + single toggle button
-            label_col, btn_col = st.columns([3, 1])
+            render_responses()
 
-            with label_col:
-                st.markdown(
-                    f'<p class="section-label">{UIConfig.MODEL_ANSWERS_LABEL}</p>',
-                    unsafe_allow_html=True,
-                )
+    @staticmethod
+    def render_responses(
+        responses: Sequence["ModelResponse"],
+        show_user_prompt: bool,
+        on_toggle_user_prompt: Callable[[], None],
+        total_tokens: int = 0,
+        page: int = 0,
+        on_page_change: Optional[Callable[[int], None]] = None,
+    ) -> None:
+        """Render the Engage answers panel: toggle button and responses list."""
+        # Header row: label + single toggle button
+        label_col, btn_col = st.columns([3, 1])
 
-            with btn_col:
-                if responses:
-                    user_label = ("Hide Prompt" if show_user_prompt
-                                  else UIConfig.VIEW_PROMPT_BUTTON)
-                    if st.button(
-                        user_label,
-                        use_container_width=True,
-                        key="engage_toggle_view_prompt",
-                    ):
-                        on_toggle_user_prompt()
+        with label_col:
+            st.markdown(
+                _MODEL_ANSWERS_LABEL_HTML,
+                unsafe_allow_html=True,
+            )
+
+        with btn_col:
+            if responses:
+                user_label = ("Hide Prompt" if show_user_prompt
+                              else UIConfig.VIEW_PROMPT_BUTTON)
+                st.button(
+                    user_label,
+                    use_container_width=True,
+                    key="engage_toggle_view_prompt",
+                    on_click=on_toggle_user_prompt,
+                )
 
-            if not responses:
-                st.info(
-                    "No responses yet. Enter a prompt and click Submit to generate responses."
+        if not responses:
+            st.info(
+                "No responses yet. Enter a prompt and click Submit to generate responses."
+            )
+        else:
+            if total_tokens:
+                st.markdown(
+                    f'<p class="meta-caption">Tokens used this session: {total_tokens}</p>',
+                    unsafe_allow_html=True,
                 )
-            else:
-                for idx, response in enumerate(reversed(responses)):
-                    response_num = len(responses) - idx
-                    with st.container():
-                        st.markdown(
-                            f'<span class="response-badge">#{response_num}</span> '
-                            f"**{response.model_name}**",
-                            unsafe_allow_html=True,
-                        )
-
-                        if show_user_prompt and response.user_prompt:
-                            st.markdown(
-                                f'<div class="prompt-preview"><strong>User Prompt</strong><br/>{response.user_prompt}</div>',
-                                unsafe_allow_html=True,
-                            )
-
-                        st.markdown(
-                            f'<div class="answer-card">{response.response_text}</div>',
-                            unsafe_allow_html=True,
-                        )
-
-                        if response.tokens_used:
-                            st.markdown(
-                                f'<p class="meta-caption">Tokens: {response.tokens_used} &middot; '
-                                f'{response.timestamp.strftime("%Y-%m-%d %H:%M:%S")}</p>',
-                                unsafe_allow_html=True,
-                            )
-
-                        st.markdown("---")
+            page = _render_pager(
+                len(responses), page, on_page_change, "engage_responses"
+            )
+            st.markdown(
+                _responses_list_html(
+                    responses,
+                    page,
+                    show_system_prompt=False,
+                    show_user_prompt=show_user_prompt,
+                    cache_key="_engage_responses_html",
+                ),
+                unsafe_allow_html=True,
+            )
 
 
 class StyleComponent:
@@ -403,4 +625,4 @@ class StyleComponent:
     @staticmethod
     def inject_styles() -> None:
         """Inject custom CSS styles into the application."""
-        st.markdown(StyleConfig.CUSTOM_CSS, unsafe_allow_html=True)
+        st.markdown(_get_css_payload(), unsafe_allow_html=True)